@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Batch Recipe Import Script
+Imports many manually entered recipes in one run, loading and saving recipes.json once.
+
+Reads JSON Lines from stdin, one recipe per line, with the same fields as the
+options of import_recipe_manual.py:
+
+    {"title": "Banana Muffins", "text": "Ingredients\\n...", "prep_time": "10 min",
+     "cook_time": "25 min", "servings": "12", "description": "", "image": "", "source": ""}
+
+Only "title" and "text" are required.
+"""
+
+import json
+import os
+import sys
+
+from import_recipe_manual import create_recipe
+from recipe_store import load_recipes, save_recipes
+
+
+# Payload fields other than the required title and text
+_OPTIONAL_FIELDS = ('prep_time', 'cook_time', 'servings', 'description', 'image', 'source')
+
+
+def read_payloads(stream):
+    """
+    Parse and validate JSON Lines recipe payloads, skipping blank lines.
+
+    Raises:
+        ValueError: If a line isn't a JSON object with string title and text,
+            or has an optional field that isn't a string
+    """
+    payloads = []
+    for line_no, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            payload = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Line {line_no}: invalid JSON ({e})") from e
+        if not isinstance(payload, dict):
+            raise ValueError(f"Line {line_no}: expected an object with 'title' and 'text'")
+        for field in ('title', 'text'):
+            if not isinstance(payload.get(field), str) or not payload[field]:
+                raise ValueError(f"Line {line_no}: '{field}' must be a non-empty string")
+        for field in _OPTIONAL_FIELDS:
+            if field in payload and not isinstance(payload[field], str):
+                raise ValueError(f"Line {line_no}: '{field}' must be a string")
+        payloads.append(payload)
+    return payloads
+
+
+def batch_import(payloads, recipes_file):
+    """
+    Add recipes from parsed payloads, overwriting existing recipes with the same ID.
+
+    Args:
+        payloads: List of dicts with recipe fields (see module docstring)
+        recipes_file: Path to the recipes JSON file
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    if not payloads:
+        print("No recipes found on stdin.")
+        return False
+
+    recipes = load_recipes(recipes_file)
+    id_to_index = {r['id']: i for i, r in enumerate(recipes)}
+
+    for payload in payloads:
+        recipe_data = create_recipe(
+            title=payload['title'],
+            recipe_text=payload['text'],
+            prep_time=payload.get('prep_time', ''),
+            cook_time=payload.get('cook_time', ''),
+            servings=payload.get('servings', ''),
+            description=payload.get('description', ''),
+            image_url=payload.get('image', ''),
+            source_url=payload.get('source', '')
+        )
+
+        if recipe_data['id'] in id_to_index:
+            print(f"⚠️  Recipe with ID '{recipe_data['id']}' already exists. Auto-overwriting...")
+            recipes[id_to_index[recipe_data['id']]] = recipe_data
+        else:
+            id_to_index[recipe_data['id']] = len(recipes)
+            recipes.append(recipe_data)
+
+        print(f"✓ {recipe_data['title']} ({len(recipe_data['ingredients'])} ingredients, "
+              f"{len(recipe_data['instructions'])} instructions)")
+
+    # Save once for the whole batch
+    save_recipes(recipes, recipes_file)
+
+    print(f"\n✅ Imported {len(payloads)} recipe(s)")
+    print(f"Total recipes in collection: {len(recipes)}")
+
+    return True
+
+
+def main():
+    """Main entry point for the script."""
+    if len(sys.argv) > 1:
+        print("Usage: python batch_import.py < recipes.jsonl")
+        print("\nEach line is a JSON object with 'title' and 'text', plus optional")
+        print("'prep_time', 'cook_time', 'servings', 'description', 'image' and 'source'.")
+        sys.exit(1)
+
+    # Determine the path to recipes.json
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    recipes_file = os.path.join(script_dir, '..', 'data', 'recipes.json')
+
+    try:
+        payloads = read_payloads(sys.stdin)
+        success = batch_import(payloads, recipes_file)
+        if not success:
+            sys.exit(1)
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
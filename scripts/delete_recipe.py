@@ -4,23 +4,10 @@ Recipe Deletion Script
 Deletes a recipe from the collection by its ID.
 """
 
-import json
 import os
 import sys
 
-
-def load_recipes(recipes_file):
-    """Load existing recipes from JSON file."""
-    if os.path.exists(recipes_file):
-        with open(recipes_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return []
-
-
-def save_recipes(recipes, recipes_file):
-    """Save recipes to JSON file."""
-    with open(recipes_file, 'w', encoding='utf-8') as f:
-        json.dump(recipes, f, indent=2, ensure_ascii=False)
+from recipe_store import load_recipes, save_recipes
 
 
 def delete_recipe(recipe_id, recipes_file):
@@ -44,13 +31,9 @@ def delete_recipe(recipe_id, recipes_file):
         return False
 
     # Find the recipe to delete
-    recipe_to_delete = None
-    for recipe in recipes:
-        if recipe['id'] == recipe_id:
-            recipe_to_delete = recipe
-            break
+    index = next((i for i, recipe in enumerate(recipes) if recipe['id'] == recipe_id), None)
 
-    if not recipe_to_delete:
+    if index is None:
         print(f"Error: Recipe with ID '{recipe_id}' not found.")
         print(f"\nAvailable recipe IDs:")
         for recipe in recipes:
@@ -58,7 +41,7 @@ def delete_recipe(recipe_id, recipes_file):
         return False
 
     # Remove the recipe
-    recipes = [r for r in recipes if r['id'] != recipe_id]
+    recipe_to_delete = recipes.pop(index)
 
     # Save updated recipes
     save_recipes(recipes, recipes_file)
@@ -4,21 +4,66 @@ Manual Recipe Import Script
 Parses recipe text (from OCR or manual entry) and adds it to recipes.json
 """
 
-import json
 import os
 import sys
 import argparse
 import re
-from datetime import date
 
+from recipe_store import append_recipe, generate_recipe_id, load_recipes, save_recipes, today_iso
 
-def generate_recipe_id(title):
-    """Generate a URL-friendly ID from the recipe title."""
-    recipe_id = title.lower()
-    recipe_id = re.sub(r'[^a-z0-9\s-]', '', recipe_id)
-    recipe_id = re.sub(r'\s+', '-', recipe_id)
-    recipe_id = re.sub(r'-+', '-', recipe_id)
-    return recipe_id.strip('-')
+# Rule used to frame the parsed recipe preview
+_PREVIEW_RULE = '=' * 60
+
+# Recipe text comes from arbitrary pasted/OCR input. Set RECIPES_USE_RE2=1 to
+# compile the parsing patterns with google-re2 (pip install google-re2), which
+# matches in linear time and so can't hang on pathological input. Note that
+# RE2's \s, \d and \b only cover ASCII.
+_re = re
+if os.environ.get('RECIPES_USE_RE2'):
+    try:
+        import re2 as _re
+    except ImportError:
+        print("⚠️  RECIPES_USE_RE2 is set but google-re2 isn't installed; using re")
+
+# Section separators and numbered-list splitting, matched in a single pass
+# when normalizing recipe text
+_SEPARATOR_PATTERN = (
+    r'⸻{2,}'  # horizontal bar separator (⸻⸻+)
+    r'|—{2,}'  # multiple em-dashes (——+)
+    r'|-{3,}'  # triple dash (---)
+    r'|={3,}'  # triple equals (===)
+)
+_NORMALIZE_RE = _re.compile(
+    rf'(?P<sep>{_SEPARATOR_PATTERN})'
+    # A numbered step following other text; separators directly after the
+    # number collapse into its trailing whitespace
+    rf'|(?P<num>([^\n])(\d+)\.(?:\s|{_SEPARATOR_PATTERN})+)'
+)
+
+# Keywords that indicate section headers (matched anywhere in the lowercased line)
+_INGREDIENT_HEADER_RE = _re.compile(r'ingredient|what you need|you will need')
+_INSTRUCTION_HEADER_RE = _re.compile(r'instruction|direction|steps|method|preparation|how to make')
+
+# Per-line patterns used by parse_recipe_text
+_NUMBERED_RE = _re.compile(r'^\d+\.')
+_NUMBERED_PREFIX_RE = _re.compile(r'^\d+\.\s*')
+_BULLET_PREFIX_RE = _re.compile(r'^[•\-\*]\s*')
+_BULLET_RE = _re.compile(r'^[•\-\*]\s+')
+# Measurement words (cup, cups, tablespoon, tbsp, teaspoon, tsp, ounce, oz, pound,
+# lb, gram, grams, g, kg, ml, liter, pinch, dash) as a trie keyed on the first
+# letter, so each position costs one branch test instead of one per word
+_MEASUREMENT_RE = _re.compile(
+    r'\b(?:c(?:ups?)|d(?:ash)|g(?:rams?)?|k(?:g)|l(?:b|iter)|m(?:l)'
+    r'|o(?:unce|z)|p(?:inch|ound)|t(?:ablespoon|bsp|easpoon|sp))\b'
+)
+_STARTS_QTY_RE = _re.compile(r'^\d+(/\d+)?\s*(½|¼|¾)?\s*(cup|tbsp|tsp|oz|lb|g|kg|ml)')
+
+
+def _normalize_match(match):
+    """Replacement for _NORMALIZE_RE: separators become blank lines, numbered steps start a new line."""
+    if match.lastgroup == 'sep':
+        return '\n\n'
+    return f"{match.group(3)}\n{match.group(4)}. "
 
 
 def parse_recipe_text(text):
@@ -40,34 +85,28 @@ def parse_recipe_text(text):
 
     # Replace common section separators (⸻, ---, ===) with double newlines
     # But NOT single em-dashes which are often used in sentences
-    normalized = re.sub(r'\u2e3b{2,}', '\n\n', normalized)  # horizontal bar separator (⸻⸻+)
-    normalized = re.sub(r'\u2014{2,}', '\n\n', normalized)  # multiple em-dashes (——+)
-    normalized = re.sub(r'-{3,}', '\n\n', normalized)  # triple dash (---)
-    normalized = re.sub(r'={3,}', '\n\n', normalized)  # triple equals (===)
-
     # DON'T aggressively split bullets - preserve them for intelligent grouping
     # Just ensure numbered lists are on their own lines
-    normalized = re.sub(r'([^\n])(\d+)\.\s+', r'\1\n\2. ', normalized)
+    normalized = _NORMALIZE_RE.sub(_normalize_match, normalized)
 
     # Process lines while preserving leading whitespace for indentation detection
-    raw_lines = normalized.split('\n')
-    lines = []
-    for raw_line in raw_lines:
-        stripped = raw_line.strip()
-        if stripped:
-            # Store both stripped content and whether it was indented
-            indent_level = len(raw_line) - len(raw_line.lstrip())
-            lines.append((stripped, indent_level))
+    # Store both stripped content and whether it was indented; the first
+    # non-whitespace character first occurs at the indent, so index() gives
+    # the indent level without building an lstrip() copy
+    lines = [
+        (stripped, raw_line.index(stripped[0]))
+        for raw_line in normalized.split('\n')
+        if (stripped := raw_line.strip())
+    ]
 
     ingredients = []
     instructions = []
     current_section = None
     current_instruction = None  # Track current instruction being built
 
-    # Keywords that indicate section headers
-    ingredient_keywords = ['ingredient', 'ingredients', 'what you need', 'you will need']
-    instruction_keywords = ['instruction', 'instructions', 'direction', 'directions',
-                           'steps', 'method', 'preparation', 'how to make']
+    # Bind the appends once; they're called for nearly every line
+    add_ingredient = ingredients.append
+    add_instruction = instructions.append
 
     for line_data in lines:
         line, indent = line_data
@@ -75,35 +114,25 @@ def parse_recipe_text(text):
 
         # Check for section headers
         # Be more strict: section headers should be short and not part of numbered lists
-        is_numbered = re.match(r'^\d+\.', line)
-        is_ingredient_header = (
+        is_numbered = _NUMBERED_RE.match(line)
+        could_be_header = (
             not is_numbered and
-            len(line) < 100 and  # Increased from 50 to allow for more formatting
-            any(keyword in lower_line.strip() or
-                lower_line.strip().startswith(keyword + ':') or
-                lower_line.strip() == keyword
-                for keyword in ingredient_keywords)
-        )
-        is_instruction_header = (
-            not is_numbered and
-            len(line) < 100 and  # Increased from 50 to allow for more formatting
-            any(keyword in lower_line.strip() or
-                lower_line.strip().startswith(keyword + ':') or
-                lower_line.strip() == keyword
-                for keyword in instruction_keywords)
+            len(line) < 100  # Increased from 50 to allow for more formatting
         )
+        is_ingredient_header = could_be_header and _INGREDIENT_HEADER_RE.search(lower_line)
+        is_instruction_header = could_be_header and _INSTRUCTION_HEADER_RE.search(lower_line)
 
         if is_ingredient_header:
             # Save any pending instruction before switching sections
             if current_instruction:
-                instructions.append(current_instruction)
+                add_instruction(current_instruction)
                 current_instruction = None
             current_section = 'ingredients'
             continue
         elif is_instruction_header:
             # Save any pending instruction before switching sections
             if current_instruction:
-                instructions.append(current_instruction)
+                add_instruction(current_instruction)
                 current_instruction = None
             current_section = 'instructions'
             continue
@@ -115,24 +144,24 @@ def parse_recipe_text(text):
         # If we have a section, add to it
         if current_section == 'ingredients':
             # Remove leading bullet/dash markers if present
-            cleaned = re.sub(r'^[•\-\*]\s*', '', line)
+            cleaned = _BULLET_PREFIX_RE.sub('', line)
             if cleaned:
-                ingredients.append(cleaned)
+                add_ingredient(cleaned)
         elif current_section == 'instructions':
             # Check if this is a new numbered step
-            if re.match(r'^\d+\.', line):
+            if is_numbered:
                 # Save previous instruction if exists
                 if current_instruction:
-                    instructions.append(current_instruction)
+                    add_instruction(current_instruction)
                 # Start new instruction, removing the number prefix
-                current_instruction = re.sub(r'^\d+\.\s*', '', line)
+                current_instruction = _NUMBERED_PREFIX_RE.sub('', line)
             elif indent > 0 and current_instruction:
                 # Indented line - likely a sub-bullet or continuation
                 # Check if it's a bullet point
-                is_bullet = re.match(r'^[•\-\*]\s+', line)
+                is_bullet = _BULLET_RE.match(line)
                 if is_bullet:
                     # It's a sub-bullet - preserve it with formatting
-                    cleaned = re.sub(r'^[•\-\*]\s+', '', line)
+                    cleaned = _BULLET_RE.sub('', line)
                     current_instruction += f"\n  • {cleaned}"
                 else:
                     # Indented continuation without bullet
@@ -140,17 +169,17 @@ def parse_recipe_text(text):
             else:
                 # Non-indented, non-numbered line
                 # Check if it's a bullet
-                is_bullet = re.match(r'^[•\-\*]\s+', line)
+                is_bullet = _BULLET_RE.match(line)
                 if is_bullet and current_instruction:
                     # Bullet following an instruction - treat as sub-bullet
-                    cleaned = re.sub(r'^[•\-\*]\s+', '', line)
+                    cleaned = _BULLET_RE.sub('', line)
                     current_instruction += f"\n  • {cleaned}"
                 else:
                     # Save previous and start new instruction
                     if current_instruction:
-                        instructions.append(current_instruction)
+                        add_instruction(current_instruction)
                     # Remove bullet if present
-                    current_instruction = re.sub(r'^[•\-\*]\s+', '', line)
+                    current_instruction = _BULLET_RE.sub('', line)
         else:
             # Try to guess based on patterns
             # Ingredients are usually:
@@ -158,47 +187,48 @@ def parse_recipe_text(text):
             # - Start with quantity/measurement
             # - Contain measurement words (cup, tbsp, tsp, oz, lb, g, kg, etc.)
 
-            measurement_pattern = r'\b(cup|cups|tablespoon|tbsp|teaspoon|tsp|ounce|oz|pound|lb|gram|grams|g|kg|ml|liter|pinch|dash)\b'
-            has_measurement = re.search(measurement_pattern, lower_line)
-            starts_with_number_quantity = re.match(r'^\d+(/\d+)?\s*(½|¼|¾)?\s*(cup|tbsp|tsp|oz|lb|g|kg|ml)', lower_line)
             is_short = len(line) < 150
-            starts_with_step_number = re.match(r'^\d+\.', line)
 
             # Remove bullet point for pattern matching
-            cleaned_line = re.sub(r'^[•\-\*]\s*', '', line)
+            cleaned_line = _BULLET_PREFIX_RE.sub('', line)
 
-            if starts_with_step_number:
+            if is_numbered:
                 # Save previous instruction if exists
                 if current_instruction:
-                    instructions.append(current_instruction)
+                    add_instruction(current_instruction)
                 # Numbered items are instructions - strip the number prefix
-                current_instruction = re.sub(r'^\d+\.\s*', '', cleaned_line)
-            elif (has_measurement or starts_with_number_quantity) and is_short:
-                ingredients.append(cleaned_line)
+                current_instruction = _NUMBERED_PREFIX_RE.sub('', cleaned_line)
+            elif is_short and (
+                # Cheap checks first: the measurement regexes only run on short
+                # lines, and the quantity regex only on lines starting with a digit
+                _MEASUREMENT_RE.search(lower_line) or
+                (line[0].isdigit() and _STARTS_QTY_RE.match(lower_line))
+            ):
+                add_ingredient(cleaned_line)
             elif indent > 0 and current_instruction:
                 # Indented line with existing instruction - treat as sub-bullet
-                is_bullet = re.match(r'^[•\-\*]\s+', line)
+                is_bullet = _BULLET_RE.match(line)
                 if is_bullet:
-                    cleaned = re.sub(r'^[•\-\*]\s+', '', line)
+                    cleaned = _BULLET_RE.sub('', line)
                     current_instruction += f"\n  • {cleaned}"
                 else:
                     current_instruction += f"\n  {line}"
             else:
                 # Check if it's a bullet that might be a sub-step
-                is_bullet = re.match(r'^[•\-\*]\s+', line)
+                is_bullet = _BULLET_RE.match(line)
                 if is_bullet and current_instruction:
                     # Add as sub-bullet to current instruction
-                    cleaned = re.sub(r'^[•\-\*]\s+', '', line)
+                    cleaned = _BULLET_RE.sub('', line)
                     current_instruction += f"\n  • {cleaned}"
                 else:
                     # Save previous instruction if exists
                     if current_instruction:
-                        instructions.append(current_instruction)
+                        add_instruction(current_instruction)
                     current_instruction = cleaned_line
 
     # Save any final pending instruction
     if current_instruction:
-        instructions.append(current_instruction)
+        add_instruction(current_instruction)
 
     # If we couldn't parse anything, put everything in instructions
     if not ingredients and not instructions:
@@ -207,20 +237,6 @@ def parse_recipe_text(text):
     return ingredients, instructions
 
 
-def load_recipes(recipes_file):
-    """Load existing recipes from JSON file."""
-    if os.path.exists(recipes_file):
-        with open(recipes_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return []
-
-
-def save_recipes(recipes, recipes_file):
-    """Save recipes to JSON file."""
-    with open(recipes_file, 'w', encoding='utf-8') as f:
-        json.dump(recipes, f, indent=2, ensure_ascii=False)
-
-
 def create_recipe(title, recipe_text, prep_time='', cook_time='', servings='',
                  description='', image_url='', source_url=''):
     """Create a recipe dictionary from manual inputs."""
@@ -245,7 +261,7 @@ def create_recipe(title, recipe_text, prep_time='', cook_time='', servings='',
         'instructions': instructions,
         'notes': '',
         'sourceUrl': source_url,
-        'dateAdded': str(date.today())
+        'dateAdded': today_iso()
     }
 
     return recipe
@@ -280,57 +296,63 @@ def add_recipe_manual(args, recipes_file):
         source_url=args.source
     )
 
-    print(f"\n{'='*60}")
-    print(f"PARSED RECIPE PREVIEW")
-    print(f"{'='*60}")
-    print(f"\nTitle: {recipe_data['title']}")
-    print(f"ID: {recipe_data['id']}")
-    print(f"\n--- INGREDIENTS ({len(recipe_data['ingredients'])} found) ---")
-    if recipe_data['ingredients']:
-        for i, ingredient in enumerate(recipe_data['ingredients'], 1):
-            print(f"  {i}. {ingredient}")
+    # Build the preview and write it in one go rather than a print per line
+    ingredients = recipe_data['ingredients']
+    instructions = recipe_data['instructions']
+    preview = [
+        f"\n{_PREVIEW_RULE}",
+        "PARSED RECIPE PREVIEW",
+        _PREVIEW_RULE,
+        f"\nTitle: {recipe_data['title']}",
+        f"ID: {recipe_data['id']}",
+        f"\n--- INGREDIENTS ({len(ingredients)} found) ---",
+    ]
+    if ingredients:
+        preview.extend(f"  {i}. {ingredient}" for i, ingredient in enumerate(ingredients, 1))
     else:
-        print("  ⚠️  WARNING: No ingredients found!")
+        preview.append("  ⚠️  WARNING: No ingredients found!")
 
-    print(f"\n--- INSTRUCTIONS ({len(recipe_data['instructions'])} found) ---")
-    if recipe_data['instructions']:
-        for i, instruction in enumerate(recipe_data['instructions'], 1):
+    preview.append(f"\n--- INSTRUCTIONS ({len(instructions)} found) ---")
+    if instructions:
+        for i, instruction in enumerate(instructions, 1):
             # Truncate long instructions for preview
             display_text = instruction[:100] + "..." if len(instruction) > 100 else instruction
-            print(f"  {i}. {display_text}")
+            preview.append(f"  {i}. {display_text}")
     else:
-        print("  ⚠️  WARNING: No instructions found!")
+        preview.append("  ⚠️  WARNING: No instructions found!")
 
-    print(f"\n{'='*60}")
+    preview.append(f"\n{_PREVIEW_RULE}")
 
     # Validate parsed content
     warnings = []
-    if not recipe_data['ingredients']:
+    if not ingredients:
         warnings.append("No ingredients were found in the recipe text")
-    if not recipe_data['instructions']:
+    if not instructions:
         warnings.append("No instructions were found in the recipe text")
-    if len(recipe_data['ingredients']) < 2:
-        warnings.append(f"Only {len(recipe_data['ingredients'])} ingredient(s) found - this seems low")
-    if len(recipe_data['instructions']) < 2:
-        warnings.append(f"Only {len(recipe_data['instructions'])} instruction(s) found - this seems low")
+    if len(ingredients) < 2:
+        warnings.append(f"Only {len(ingredients)} ingredient(s) found - this seems low")
+    if len(instructions) < 2:
+        warnings.append(f"Only {len(instructions)} instruction(s) found - this seems low")
 
     if warnings:
-        print("\n⚠️  WARNINGS:")
-        for warning in warnings:
-            print(f"  - {warning}")
-        print("\nThe recipe will still be saved, but you may want to check the formatting.")
+        preview.append("\n⚠️  WARNINGS:")
+        preview.extend(f"  - {warning}" for warning in warnings)
+        preview.append("\nThe recipe will still be saved, but you may want to check the formatting.")
+
+    sys.stdout.write('\n'.join(preview) + '\n')
 
     # Check for existing recipe with same ID
-    existing_ids = [r['id'] for r in recipes]
-    if recipe_data['id'] in existing_ids:
+    id_to_index = {r['id']: i for i, r in enumerate(recipes)}
+    if recipe_data['id'] in id_to_index:
         print(f"\n⚠️  Recipe with ID '{recipe_data['id']}' already exists. Auto-overwriting...")
-        recipes = [r for r in recipes if r['id'] != recipe_data['id']]
-
-    # Add new recipe
-    recipes.append(recipe_data)
+        recipes[id_to_index[recipe_data['id']]] = recipe_data
 
-    # Save updated recipes
-    save_recipes(recipes, recipes_file)
+        # Save updated recipes
+        save_recipes(recipes, recipes_file)
+    else:
+        # Add new recipe, encoding only the new entry
+        recipes.append(recipe_data)
+        append_recipe(recipe_data, recipes_file)
 
     print(f"\n✅ Recipe '{recipe_data['title']}' saved successfully!")
     print(f"Total recipes in collection: {len(recipes)}")
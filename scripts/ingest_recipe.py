@@ -7,72 +7,131 @@ Parses recipe URLs and extracts structured recipe data without ads and extraneou
 import json
 import os
 import sys
-from datetime import date
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from urllib.parse import urlparse
 import re
 
 try:
     from recipe_scrapers import scrape_me
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     from bs4 import BeautifulSoup
+    import lxml  # C parser backend for BeautifulSoup
+    import soupsieve
 except ImportError as e:
     print(f"Error: Required library not found: {e}")
-    print("Please install dependencies with: pip install recipe-scrapers requests beautifulsoup4")
+    print("Please install dependencies with: pip install recipe-scrapers requests beautifulsoup4 lxml")
     sys.exit(1)
 
-
-def generate_recipe_id(title):
-    """Generate a URL-friendly ID from the recipe title."""
-    # Convert to lowercase, replace spaces with hyphens, remove special chars
-    recipe_id = title.lower()
-    recipe_id = re.sub(r'[^a-z0-9\s-]', '', recipe_id)
-    recipe_id = re.sub(r'\s+', '-', recipe_id)
-    recipe_id = re.sub(r'-+', '-', recipe_id)
-    return recipe_id.strip('-')
-
-
+from recipe_store import (
+    append_recipe, decode_json, generate_recipe_id, load_recipes, save_recipes, today_iso
+)
+
+
+# ISO 8601 duration in PT#H#M or PT#M format
+_DURATION_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?')
+
+# Shared HTTP session for the schema.org fallback: reuses connections across
+# fetches and retries transient failures with backoff. Retry-After is ignored so
+# a throttling site can't stall the run with an arbitrarily long sleep
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=False
+    )
+)
+_SESSION.mount('https://', _adapter)
+_SESSION.mount('http://', _adapter)
+
+# Element carrying schema.org Recipe microdata
+_RECIPE_MICRODATA_SELECTOR = soupsieve.compile('[itemtype*="schema.org/Recipe"]')
+# Body of a JSON-LD script tag, matched on the raw page bytes
+_LD_SCRIPT_RE = re.compile(
+    rb'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.DOTALL | re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=64)
+def _itemprop_selector(prop_name):
+    """Compiled CSS selector for elements with the given itemprop, reused across recipes."""
+    return soupsieve.compile(f'[itemprop="{prop_name}"]')
+
+
+@lru_cache(maxsize=256)
 def parse_duration(duration_str):
     """Parse ISO 8601 duration string to minutes."""
     if not duration_str:
         return ""
 
     # Match PT#H#M or PT#M format
-    match = re.match(r'PT(?:(\d+)H)?(?:(\d+)M)?', duration_str)
+    match = _DURATION_RE.match(duration_str)
     if match:
+        # int() normalizes zero-padded and zero components like PT0H05M
         hours = int(match.group(1) or 0)
         minutes = int(match.group(2) or 0)
-        total_minutes = hours * 60 + minutes
-        if total_minutes > 0:
-            if hours > 0 and minutes > 0:
-                return f"{hours}h {minutes}min"
-            elif hours > 0:
-                return f"{hours}h"
-            else:
-                return f"{minutes} min"
+        if hours and minutes:
+            return f"{hours}h {minutes}min"
+        if hours:
+            return f"{hours}h"
+        if minutes:
+            return f"{minutes} min"
     return ""
 
 
-def parse_microdata_recipe(recipe_elem, url):
+def _new_recipe(recipe_id, title, description, prep_time, cook_time, servings, image,
+                ingredients, instructions, url):
+    """Build a recipe dict with the fields in recipes.json's canonical order."""
+    return {
+        "id": recipe_id,
+        "title": title,
+        "description": description,
+        "prepTime": prep_time,
+        "cookTime": cook_time,
+        "servings": servings,
+        "image": image,
+        "tags": [],
+        "ingredients": ingredients,
+        "instructions": instructions,
+        "notes": "",
+        "sourceUrl": url,
+        "dateAdded": today_iso()
+    }
+
+
+def parse_microdata_recipe(recipe_elem, url, log=print):
     """Parse recipe data from HTML microdata format."""
     try:
         def get_itemprop(prop_name):
             """Get value from itemprop attribute."""
-            elem = recipe_elem.find(attrs={'itemprop': prop_name})
+            elem = _itemprop_selector(prop_name).select_one(recipe_elem)
             if elem:
                 # Check for content attribute first (common in meta tags)
-                if elem.get('content'):
-                    return elem.get('content')
+                content = elem.get('content')
+                if content:
+                    return content
                 # Then check for text content
                 return elem.get_text(strip=True)
             return ""
 
         def get_itemprop_list(prop_name):
             """Get list of values from itemprop attributes."""
-            elems = recipe_elem.find_all(attrs={'itemprop': prop_name})
+            elems = _itemprop_selector(prop_name).select(recipe_elem)
             results = []
             for elem in elems:
-                if elem.get('content'):
-                    results.append(elem.get('content'))
+                content = elem.get('content')
+                if content:
+                    results.append(content)
                 else:
                     text = elem.get_text(strip=True)
                     if text:
@@ -91,7 +150,7 @@ def parse_microdata_recipe(recipe_elem, url):
         servings = get_itemprop('recipeYield') or get_itemprop('yields')
 
         # Extract image
-        image_elem = recipe_elem.find(attrs={'itemprop': 'image'})
+        image_elem = _itemprop_selector('image').select_one(recipe_elem)
         image = ''
         if image_elem:
             image = image_elem.get('src') or image_elem.get('content') or ''
@@ -101,12 +160,15 @@ def parse_microdata_recipe(recipe_elem, url):
 
         # Extract instructions
         instructions = []
-        instruction_elems = recipe_elem.find_all(attrs={'itemprop': 'recipeInstructions'})
+        instruction_elems = _itemprop_selector('recipeInstructions').select(recipe_elem)
         for elem in instruction_elems:
             # Check if it has HowToStep children
-            steps = elem.find_all(attrs={'itemprop': 'text'})
+            steps = _itemprop_selector('text').select(elem)
             if steps:
-                instructions.extend([step.get_text(strip=True) for step in steps if step.get_text(strip=True)])
+                for step in steps:
+                    text = step.get_text(strip=True)
+                    if text:
+                        instructions.append(text)
             else:
                 text = elem.get_text(strip=True)
                 if text:
@@ -114,160 +176,184 @@ def parse_microdata_recipe(recipe_elem, url):
 
         # If instructions came as one block, try to split them
         if len(instructions) == 1 and '\n' in instructions[0]:
-            instructions = [s.strip() for s in instructions[0].split('\n') if s.strip()]
-
-        recipe_data = {
-            "id": generate_recipe_id(title),
-            "title": title,
-            "description": description,
-            "prepTime": prep_time,
-            "cookTime": cook_time,
-            "servings": servings,
-            "image": image,
-            "tags": [],
-            "ingredients": ingredients,
-            "instructions": instructions,
-            "notes": "",
-            "sourceUrl": url,
-            "dateAdded": date.today().isoformat()
-        }
-
-        return recipe_data
+            instructions = [s for line in instructions[0].splitlines() if (s := line.strip())]
+
+        return _new_recipe(
+            recipe_id=generate_recipe_id(title),
+            title=title,
+            description=description,
+            prep_time=prep_time,
+            cook_time=cook_time,
+            servings=servings,
+            image=image,
+            ingredients=ingredients,
+            instructions=instructions,
+            url=url
+        )
 
     except Exception as e:
-        print(f"Error parsing microdata: {e}")
+        log(f"Error parsing microdata: {e}")
         return None
 
 
-def scrape_with_schema_org(url):
+def _extract_instruction_text(items):
+    """Flatten schema.org recipeInstructions (strings, HowToStep, HowToSection) into steps."""
+    steps = []
+    # Explicit stack instead of recursion; children are pushed reversed to keep order
+    stack = list(reversed(items))
+    while stack:
+        inst = stack.pop()
+        if isinstance(inst, str):
+            steps.append(inst)
+        elif isinstance(inst, dict):
+            inst_type = inst.get('@type', '')
+
+            # Handle HowToSection (contains multiple steps)
+            if inst_type == 'HowToSection':
+                # Get section name if present
+                section_name = inst.get('name', '')
+                if section_name:
+                    steps.append(f"{section_name}:")
+                stack.extend(reversed(inst.get('itemListElement', [])))
+                continue
+
+            # Handle HowToStep
+            if inst_type == 'HowToStep':
+                text = inst.get('text', '')
+                if text:
+                    steps.append(text)
+                    continue
+
+            # Fallback: try to get text or name field
+            text = inst.get('text', inst.get('name', ''))
+            if text:
+                steps.append(text)
+    return steps
+
+
+def parse_json_ld_recipe(raw, url):
+    """Parse recipe data from the contents of one JSON-LD script tag (str or UTF-8 bytes)."""
+    try:
+        data = decode_json(raw)
+
+        # Handle @graph format
+        if isinstance(data, dict) and '@graph' in data:
+            data = data['@graph']
+
+        # Handle array format
+        if isinstance(data, list):
+            # Find Recipe type
+            recipe = next((item for item in data if item.get('@type') == 'Recipe'), None)
+            if recipe:
+                data = recipe
+
+        # Check if this is a Recipe
+        if isinstance(data, dict) and data.get('@type') == 'Recipe':
+            # Extract ingredients
+            ingredients = data.get('recipeIngredient', [])
+            if isinstance(ingredients, str):
+                ingredients = [ingredients]
+
+            # Extract instructions
+            instructions_raw = data.get('recipeInstructions', [])
+            instructions = []
+
+            if isinstance(instructions_raw, str):
+                instructions = [instructions_raw]
+            elif isinstance(instructions_raw, list):
+                instructions = _extract_instruction_text(instructions_raw)
+
+            # Extract servings
+            servings = ""
+            if 'recipeYield' in data:
+                yield_val = data['recipeYield']
+                if isinstance(yield_val, list):
+                    servings = str(yield_val[0]) if yield_val else ""
+                else:
+                    servings = str(yield_val)
+
+            # Extract image (an ImageObject, a list of URLs or a plain URL)
+            image = data.get('image', '')
+            if isinstance(image, dict):
+                image = image.get('url', '')
+            elif isinstance(image, list):
+                image = image[0] if image else ''
+
+            return _new_recipe(
+                recipe_id=generate_recipe_id(data.get('name', 'untitled')),
+                title=data.get('name', 'Untitled Recipe'),
+                description=data.get('description', ''),
+                prep_time=parse_duration(data.get('prepTime', '')),
+                cook_time=parse_duration(data.get('cookTime', '')),
+                servings=servings,
+                image=image,
+                ingredients=ingredients,
+                instructions=instructions,
+                url=url
+            )
+
+    except (json.JSONDecodeError, UnicodeDecodeError, AttributeError, KeyError):
+        pass
+
+    return None
+
+
+def scrape_with_schema_org(url, log=print):
     """
     Fallback scraper using schema.org structured data (JSON-LD or microdata).
     Most recipe websites include this for SEO purposes.
     """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _SESSION.get(url, timeout=10)
         response.raise_for_status()
+        content = response.content
+
+        # Microdata needs the parsed tree, so only build it when the page can have any
+        soup = None
+        if b'schema.org/Recipe' in content:
+            soup = BeautifulSoup(content, 'lxml')
+
+            # First, try to find microdata (HTML with itemtype attribute)
+            recipe_microdata = _RECIPE_MICRODATA_SELECTOR.select_one(soup)
+            if recipe_microdata:
+                log("Found microdata recipe structure")
+                recipe_data = parse_microdata_recipe(recipe_microdata, url, log)
+                if recipe_data:
+                    return recipe_data
 
-        soup = BeautifulSoup(response.content, 'html.parser')
-
-        # First, try to find microdata (HTML with itemtype attribute)
-        recipe_microdata = soup.find(attrs={'itemtype': lambda x: x and 'schema.org/Recipe' in x if x else False})
-        if recipe_microdata:
-            print("Found microdata recipe structure")
-            recipe_data = parse_microdata_recipe(recipe_microdata, url)
+        # Fall back to JSON-LD script tags, cut straight out of the raw page.
+        # Most pages ship several LD blocks (breadcrumbs, organization, ...);
+        # only decode the ones that can contain a Recipe
+        for match in _LD_SCRIPT_RE.finditer(content):
+            raw = match.group(1)
+            if b'"Recipe"' not in raw:
+                continue
+            recipe_data = parse_json_ld_recipe(raw, url)
             if recipe_data:
                 return recipe_data
 
-        # Fall back to JSON-LD script tags
-        scripts = soup.find_all('script', type='application/ld+json')
-
-        for script in scripts:
-            try:
-                data = json.loads(script.string)
-
-                # Handle @graph format
-                if isinstance(data, dict) and '@graph' in data:
-                    data = data['@graph']
-
-                # Handle array format
-                if isinstance(data, list):
-                    # Find Recipe type
-                    recipe = next((item for item in data if item.get('@type') == 'Recipe'), None)
-                    if recipe:
-                        data = recipe
-
-                # Check if this is a Recipe
-                if isinstance(data, dict) and data.get('@type') == 'Recipe':
-                    # Extract ingredients
-                    ingredients = data.get('recipeIngredient', [])
-                    if isinstance(ingredients, str):
-                        ingredients = [ingredients]
-
-                    # Extract instructions
-                    instructions_raw = data.get('recipeInstructions', [])
-                    instructions = []
-
-                    def extract_instruction_text(inst):
-                        """Recursively extract instruction text from various schema.org formats."""
-                        if isinstance(inst, str):
-                            return [inst]
-                        elif isinstance(inst, dict):
-                            inst_type = inst.get('@type', '')
-
-                            # Handle HowToSection (contains multiple steps)
-                            if inst_type == 'HowToSection':
-                                section_steps = []
-                                # Get section name if present
-                                section_name = inst.get('name', '')
-                                if section_name:
-                                    section_steps.append(f"{section_name}:")
-
-                                # Extract steps within the section
-                                items = inst.get('itemListElement', [])
-                                for item in items:
-                                    section_steps.extend(extract_instruction_text(item))
-                                return section_steps
-
-                            # Handle HowToStep
-                            elif inst_type == 'HowToStep':
-                                text = inst.get('text', '')
-                                if text:
-                                    return [text]
-
-                            # Fallback: try to get text or name field
-                            text = inst.get('text', inst.get('name', ''))
-                            if text:
-                                return [text]
-
-                        return []
-
-                    if isinstance(instructions_raw, str):
-                        instructions = [instructions_raw]
-                    elif isinstance(instructions_raw, list):
-                        for inst in instructions_raw:
-                            instructions.extend(extract_instruction_text(inst))
-
-                    # Extract servings
-                    servings = ""
-                    if 'recipeYield' in data:
-                        yield_val = data['recipeYield']
-                        if isinstance(yield_val, list):
-                            servings = str(yield_val[0]) if yield_val else ""
-                        else:
-                            servings = str(yield_val)
-
-                    recipe_data = {
-                        "id": generate_recipe_id(data.get('name', 'untitled')),
-                        "title": data.get('name', 'Untitled Recipe'),
-                        "description": data.get('description', ''),
-                        "prepTime": parse_duration(data.get('prepTime', '')),
-                        "cookTime": parse_duration(data.get('cookTime', '')),
-                        "servings": servings,
-                        "image": data.get('image', {}).get('url', '') if isinstance(data.get('image'), dict) else (data.get('image', [''])[0] if isinstance(data.get('image'), list) else data.get('image', '')),
-                        "tags": [],
-                        "ingredients": ingredients,
-                        "instructions": instructions,
-                        "notes": "",
-                        "sourceUrl": url,
-                        "dateAdded": date.today().isoformat()
-                    }
-
-                    return recipe_data
+        # The regex misses unusual markup (unquoted attributes, non-UTF-8 pages),
+        # so give the HTML parser the last look
+        if soup is None:
+            soup = BeautifulSoup(content, 'lxml')
 
-            except (json.JSONDecodeError, AttributeError, KeyError) as e:
+        for script in soup.find_all('script', type='application/ld+json'):
+            # str() because orjson rejects str subclasses like NavigableString
+            raw = str(script.string or '')
+            if '"Recipe"' not in raw:
                 continue
+            recipe_data = parse_json_ld_recipe(raw, url)
+            if recipe_data:
+                return recipe_data
 
         return None
 
     except Exception as e:
-        print(f"Schema.org fallback error: {e}")
+        log(f"Schema.org fallback error: {e}")
         return None
 
 
-def scrape_recipe(url):
+def scrape_recipe(url, log=print):
     """
     Scrape recipe data from a URL.
 
@@ -276,73 +362,64 @@ def scrape_recipe(url):
 
     Args:
         url: The recipe URL to scrape
+        log: Callable for progress messages (print by default)
 
     Returns:
         dict: Structured recipe data
     """
     # First, try recipe-scrapers library
     try:
-        print("Trying recipe-scrapers library...")
+        log("Trying recipe-scrapers library...")
         scraper = scrape_me(url)
 
-        recipe_data = {
-            "id": generate_recipe_id(scraper.title()),
-            "title": scraper.title(),
-            "description": scraper.description() if hasattr(scraper, 'description') else "",
-            "prepTime": f"{scraper.prep_time()} min" if scraper.prep_time() else "",
-            "cookTime": f"{scraper.cook_time()} min" if scraper.cook_time() else "",
-            "servings": str(scraper.yields()) if scraper.yields() else "",
-            "image": scraper.image() if scraper.image() else "",
-            "tags": [],
-            "ingredients": scraper.ingredients(),
-            "instructions": scraper.instructions_list() if hasattr(scraper, 'instructions_list') else [scraper.instructions()],
-            "notes": "",
-            "sourceUrl": url,
-            "dateAdded": date.today().isoformat()
-        }
+        # Each scraper method re-walks the page, so call them once each
+        title = scraper.title()
+        prep_time = scraper.prep_time()
+        cook_time = scraper.cook_time()
+        servings = scraper.yields()
+        image = scraper.image()
+
+        recipe_data = _new_recipe(
+            recipe_id=generate_recipe_id(title),
+            title=title,
+            description=scraper.description() if hasattr(scraper, 'description') else "",
+            prep_time=f"{prep_time} min" if prep_time else "",
+            cook_time=f"{cook_time} min" if cook_time else "",
+            servings=str(servings) if servings else "",
+            image=image if image else "",
+            ingredients=scraper.ingredients(),
+            instructions=scraper.instructions_list() if hasattr(scraper, 'instructions_list') else [scraper.instructions()],
+            url=url
+        )
 
         # Clean up instructions if they came as a single string
         if len(recipe_data["instructions"]) == 1 and '\n' in recipe_data["instructions"][0]:
             recipe_data["instructions"] = [
-                step.strip() for step in recipe_data["instructions"][0].split('\n')
-                if step.strip()
+                step for line in recipe_data["instructions"][0].splitlines()
+                if (step := line.strip())
             ]
 
-        print("✓ Successfully scraped with recipe-scrapers library")
+        log("✓ Successfully scraped with recipe-scrapers library")
         return recipe_data
 
     except Exception as e:
         error_msg = str(e)
-        print(f"Recipe-scrapers failed: {error_msg}")
+        log(f"Recipe-scrapers failed: {error_msg}")
 
         # Try schema.org fallback for any recipe-scrapers failure
         # This handles unsupported sites, missing data, or parsing errors
-        print("Trying schema.org fallback parser...")
-        recipe_data = scrape_with_schema_org(url)
+        log("Trying schema.org fallback parser...")
+        recipe_data = scrape_with_schema_org(url, log)
 
         if recipe_data:
-            print("✓ Successfully scraped with schema.org fallback")
+            log("✓ Successfully scraped with schema.org fallback")
             return recipe_data
         else:
-            print("✗ Schema.org fallback failed - no structured data found")
+            log("✗ Schema.org fallback failed - no structured data found")
 
         return None
 
 
-def load_recipes(recipes_file):
-    """Load existing recipes from JSON file."""
-    if os.path.exists(recipes_file):
-        with open(recipes_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return []
-
-
-def save_recipes(recipes, recipes_file):
-    """Save recipes to JSON file."""
-    with open(recipes_file, 'w', encoding='utf-8') as f:
-        json.dump(recipes, f, indent=2, ensure_ascii=False)
-
-
 def add_recipe(url, recipes_file='../data/recipes.json', auto_overwrite=False):
     """
     Add a new recipe from a URL.
@@ -367,28 +444,29 @@ def add_recipe(url, recipes_file='../data/recipes.json', auto_overwrite=False):
     recipes = load_recipes(recipes_file)
 
     # Check if recipe already exists
-    existing_ids = [r['id'] for r in recipes]
-    if recipe_data['id'] in existing_ids:
+    id_to_index = {r['id']: i for i, r in enumerate(recipes)}
+    if recipe_data['id'] in id_to_index:
         if auto_overwrite:
             print(f"Recipe with similar title already exists. Auto-overwriting...")
-            recipes = [r for r in recipes if r['id'] != recipe_data['id']]
         elif sys.stdin.isatty():
             # Only prompt if running interactively
             response = input(f"Recipe with similar title already exists. Overwrite? (y/n): ")
             if response.lower() != 'y':
                 print("Recipe not added.")
                 sys.exit(0)
-            recipes = [r for r in recipes if r['id'] != recipe_data['id']]
         else:
             # In non-interactive mode (like GitHub Actions), auto-overwrite
             print(f"Recipe with similar title already exists. Auto-overwriting in non-interactive mode...")
-            recipes = [r for r in recipes if r['id'] != recipe_data['id']]
 
-    # Add new recipe
-    recipes.append(recipe_data)
+        # Replace the existing recipe in place
+        recipes[id_to_index[recipe_data['id']]] = recipe_data
 
-    # Save updated recipes
-    save_recipes(recipes, recipes_file)
+        # Save updated recipes
+        save_recipes(recipes, recipes_file)
+    else:
+        # Add new recipe, encoding only the new entry
+        recipes.append(recipe_data)
+        append_recipe(recipe_data, recipes_file)
 
     print(f"Recipe '{recipe_data['title']}' added successfully!")
     print(f"Total recipes: {len(recipes)}")
@@ -396,22 +474,88 @@ def add_recipe(url, recipes_file='../data/recipes.json', auto_overwrite=False):
     return True
 
 
+def _scrape_buffered(url):
+    """Scrape a URL, collecting its progress messages instead of printing them."""
+    messages = []
+    return scrape_recipe(url, log=messages.append), messages
+
+
+def add_recipes(urls, recipes_file='../data/recipes.json', max_workers=8):
+    """
+    Add recipes from several URLs, fetching them concurrently.
+
+    Scraping is network-bound, so the URLs are scraped in a thread pool. The
+    results are then merged in URL order and the collection is saved once.
+    Existing recipes with the same ID are overwritten.
+
+    Args:
+        urls: The recipe URLs to scrape
+        recipes_file: Path to the recipes JSON file
+        max_workers: Maximum number of concurrent scrapes
+
+    Returns:
+        bool: True if every URL was scraped successfully
+    """
+    print(f"Scraping {len(urls)} recipes...")
+
+    # Workers buffer their messages so each URL's log is printed as one block
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_scrape_buffered, urls))
+
+    # Load existing recipes
+    recipes = load_recipes(recipes_file)
+    id_to_index = {r['id']: i for i, r in enumerate(recipes)}
+
+    failed = []
+    for url, (recipe_data, messages) in zip(urls, results):
+        print(f"\nScraping recipe from: {url}")
+        for message in messages:
+            print(f"  {message}")
+
+        if not recipe_data:
+            failed.append(url)
+            continue
+
+        if recipe_data['id'] in id_to_index:
+            print(f"Recipe '{recipe_data['title']}' already exists. Auto-overwriting...")
+            recipes[id_to_index[recipe_data['id']]] = recipe_data
+        else:
+            id_to_index[recipe_data['id']] = len(recipes)
+            recipes.append(recipe_data)
+        print(f"Recipe '{recipe_data['title']}' added successfully!")
+
+    # Save updated recipes once for the whole batch
+    if len(failed) < len(urls):
+        save_recipes(recipes, recipes_file)
+
+    if failed:
+        print("\nFailed to scrape:")
+        for url in failed:
+            print(f"  - {url}")
+    print(f"Total recipes: {len(recipes)}")
+
+    return not failed
+
+
 def main():
     """Main entry point for the script."""
     if len(sys.argv) < 2:
-        print("Usage: python ingest_recipe.py <recipe_url>")
+        print("Usage: python ingest_recipe.py <recipe_url> [<recipe_url> ...]")
         print("\nExample:")
         print("  python ingest_recipe.py https://www.allrecipes.com/recipe/10813/best-chocolate-chip-cookies/")
         sys.exit(1)
 
-    url = sys.argv[1]
+    urls = sys.argv[1:]
 
     # Determine the path to recipes.json
     script_dir = os.path.dirname(os.path.abspath(__file__))
     recipes_file = os.path.join(script_dir, '..', 'data', 'recipes.json')
 
     try:
-        success = add_recipe(url, recipes_file)
+        if len(urls) > 1:
+            success = add_recipes(urls, recipes_file)
+        else:
+            success = add_recipe(urls[0], recipes_file)
         if not success:
             sys.exit(1)
     except Exception as e:
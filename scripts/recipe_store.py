@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Recipe Store
+Shared helpers for recipe IDs, dateAdded stamps and reading and writing
+data/recipes.json, used by every script.
+
+Only the standard library is required; orjson is used when it is installed.
+"""
+
+import json
+import mmap
+import os
+from datetime import date
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    # Optional: the stdlib json module is used when orjson isn't installed
+    orjson = None
+
+
+_RECIPE_ID_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz0123456789')
+
+
+class _RecipeIdTable(dict):
+    """
+    str.translate table for generate_recipe_id.
+
+    Keeps [a-z0-9], turns whitespace and hyphens into spaces and drops
+    everything else. Entries are filled in lazily as characters are seen.
+    """
+
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        if char in _RECIPE_ID_CHARS:
+            value = codepoint
+        elif char == '-' or char.isspace():
+            value = ' '
+        else:
+            value = None
+        self[codepoint] = value
+        return value
+
+
+_RECIPE_ID_TABLE = _RecipeIdTable()
+
+
+def generate_recipe_id(title):
+    """Generate a URL-friendly ID from the recipe title."""
+    # Drop special chars in one pass, then collapse whitespace/hyphen runs into single hyphens
+    recipe_id = title.lower().translate(_RECIPE_ID_TABLE)
+    return '-'.join(recipe_id.split())
+
+
+@lru_cache(maxsize=1)
+def today_iso():
+    """Today's date in ISO format for dateAdded, computed once per run."""
+    return date.today().isoformat()
+
+
+def decode_json(data):
+    """Decode JSON from a str or UTF-8 bytes-like object."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def load_recipes(recipes_file):
+    """Load existing recipes from JSON file."""
+    if os.path.exists(recipes_file):
+        with open(recipes_file, 'rb') as f:
+            if orjson and os.fstat(f.fileno()).st_size:
+                # Parse straight from the mapped file rather than reading a copy
+                # of it into memory first
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as view:
+                        return orjson.loads(view)
+            data = f.read()
+        return decode_json(data)
+    return []
+
+
+def _dump_json(value):
+    """Serialize a value to UTF-8 JSON bytes in the recipes.json layout (2-space indent)."""
+    if orjson:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _write_atomic(recipes_file, data):
+    """Write bytes to a temp file beside recipes_file, then swap it into place."""
+    tmp_file = recipes_file + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, recipes_file)
+
+
+def save_recipes(recipes, recipes_file):
+    """Save recipes to JSON file."""
+    _write_atomic(recipes_file, _dump_json(recipes))
+
+
+def append_recipe(recipe, recipes_file):
+    """
+    Append a single recipe to the JSON file without re-encoding the others.
+
+    The existing bytes are kept up to the array's closing bracket and only the
+    new recipe is serialized and spliced in, producing the same output as
+    save_recipes. Falls back to a full save if the file is missing or isn't a
+    non-empty array.
+    """
+    data = b''
+    if os.path.exists(recipes_file):
+        with open(recipes_file, 'rb') as f:
+            data = f.read().rstrip()
+    head = data[:-1].rstrip()
+
+    if not data.endswith(b']') or not head.endswith(b'}'):
+        save_recipes(load_recipes(recipes_file) + [recipe], recipes_file)
+        return
+
+    entry = _dump_json(recipe)
+    # Nest one level into the array (encoded JSON never contains raw newlines in strings)
+    entry = b'\n'.join(b'  ' + line for line in entry.split(b'\n'))
+
+    _write_atomic(recipes_file, head + b',\n' + entry + b'\n]')
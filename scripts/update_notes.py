@@ -4,23 +4,10 @@ Recipe Notes Update Script
 Updates the notes field for a specific recipe.
 """
 
-import json
 import os
 import sys
 
-
-def load_recipes(recipes_file):
-    """Load existing recipes from JSON file."""
-    if os.path.exists(recipes_file):
-        with open(recipes_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return []
-
-
-def save_recipes(recipes, recipes_file):
-    """Save recipes to JSON file."""
-    with open(recipes_file, 'w', encoding='utf-8') as f:
-        json.dump(recipes, f, indent=2, ensure_ascii=False)
+from recipe_store import load_recipes, save_recipes
 
 
 def update_recipe_notes(recipe_id, notes, recipes_file):
@@ -45,21 +32,18 @@ def update_recipe_notes(recipe_id, notes, recipes_file):
         return False
 
     # Find the recipe to update
-    recipe_found = False
-    for recipe in recipes:
-        if recipe['id'] == recipe_id:
-            recipe['notes'] = notes
-            recipe_found = True
-            print(f"\n✓ Successfully updated notes for: {recipe['title']}")
-            break
-
-    if not recipe_found:
+    recipe = next((r for r in recipes if r['id'] == recipe_id), None)
+
+    if recipe is None:
         print(f"Error: Recipe with ID '{recipe_id}' not found.")
         print(f"\nAvailable recipe IDs:")
         for recipe in recipes:
             print(f"  - {recipe['id']}")
         return False
 
+    recipe['notes'] = notes
+    print(f"\n✓ Successfully updated notes for: {recipe['title']}")
+
     # Save updated recipes
     save_recipes(recipes, recipes_file)
 
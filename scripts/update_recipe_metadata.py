@@ -4,24 +4,11 @@ Recipe Metadata Update Script
 Updates various metadata fields for a specific recipe.
 """
 
-import json
 import os
 import sys
 import argparse
 
-
-def load_recipes(recipes_file):
-    """Load existing recipes from JSON file."""
-    if os.path.exists(recipes_file):
-        with open(recipes_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return []
-
-
-def save_recipes(recipes, recipes_file):
-    """Save recipes to JSON file."""
-    with open(recipes_file, 'w', encoding='utf-8') as f:
-        json.dump(recipes, f, indent=2, ensure_ascii=False)
+from recipe_store import load_recipes, save_recipes
 
 
 def update_recipe_metadata(recipe_id, recipes_file, **updates):
@@ -45,72 +32,67 @@ def update_recipe_metadata(recipe_id, recipes_file, **updates):
         return False
 
     # Find the recipe to update
-    recipe_found = False
-    updated_fields = []
+    recipe = next((r for r in recipes if r['id'] == recipe_id), None)
 
-    for recipe in recipes:
-        if recipe['id'] == recipe_id:
-            recipe_found = True
-
-            print(f"\n{'='*60}")
-            print(f"Updating recipe: {recipe['title']}")
-            print(f"{'='*60}\n")
-
-            # Update each provided field
-            if 'description' in updates and updates['description'] is not None:
-                old_value = recipe.get('description', '')
-                recipe['description'] = updates['description']
-                updated_fields.append('description')
-                print(f"✓ Description updated")
-                if old_value:
-                    print(f"  Old: {old_value[:60]}...")
-                print(f"  New: {updates['description'][:60]}...")
-
-            if 'image' in updates and updates['image'] is not None:
-                old_value = recipe.get('image', '')
-                recipe['image'] = updates['image']
-                updated_fields.append('image')
-                print(f"✓ Image URL updated")
-                if old_value:
-                    print(f"  Old: {old_value}")
-                print(f"  New: {updates['image']}")
-
-            if 'prepTime' in updates and updates['prepTime'] is not None:
-                old_value = recipe.get('prepTime', '')
-                recipe['prepTime'] = updates['prepTime']
-                updated_fields.append('prepTime')
-                print(f"✓ Prep time: {old_value} → {updates['prepTime']}")
-
-            if 'cookTime' in updates and updates['cookTime'] is not None:
-                old_value = recipe.get('cookTime', '')
-                recipe['cookTime'] = updates['cookTime']
-                updated_fields.append('cookTime')
-                print(f"✓ Cook time: {old_value} → {updates['cookTime']}")
-
-            if 'servings' in updates and updates['servings'] is not None:
-                old_value = recipe.get('servings', '')
-                recipe['servings'] = updates['servings']
-                updated_fields.append('servings')
-                print(f"✓ Servings: {old_value} → {updates['servings']}")
-
-            if 'sourceUrl' in updates and updates['sourceUrl'] is not None:
-                old_value = recipe.get('sourceUrl', '')
-                recipe['sourceUrl'] = updates['sourceUrl']
-                updated_fields.append('sourceUrl')
-                print(f"✓ Source URL updated")
-                if old_value:
-                    print(f"  Old: {old_value}")
-                print(f"  New: {updates['sourceUrl']}")
-
-            break
-
-    if not recipe_found:
+    if recipe is None:
         print(f"❌ Error: Recipe with ID '{recipe_id}' not found.")
         print(f"\nAvailable recipe IDs:")
         for recipe in recipes:
             print(f"  - {recipe['id']}")
         return False
 
+    updated_fields = []
+
+    print(f"\n{'='*60}")
+    print(f"Updating recipe: {recipe['title']}")
+    print(f"{'='*60}\n")
+
+    # Update each provided field
+    if 'description' in updates and updates['description'] is not None:
+        old_value = recipe.get('description', '')
+        recipe['description'] = updates['description']
+        updated_fields.append('description')
+        print(f"✓ Description updated")
+        if old_value:
+            print(f"  Old: {old_value[:60]}...")
+        print(f"  New: {updates['description'][:60]}...")
+
+    if 'image' in updates and updates['image'] is not None:
+        old_value = recipe.get('image', '')
+        recipe['image'] = updates['image']
+        updated_fields.append('image')
+        print(f"✓ Image URL updated")
+        if old_value:
+            print(f"  Old: {old_value}")
+        print(f"  New: {updates['image']}")
+
+    if 'prepTime' in updates and updates['prepTime'] is not None:
+        old_value = recipe.get('prepTime', '')
+        recipe['prepTime'] = updates['prepTime']
+        updated_fields.append('prepTime')
+        print(f"✓ Prep time: {old_value} → {updates['prepTime']}")
+
+    if 'cookTime' in updates and updates['cookTime'] is not None:
+        old_value = recipe.get('cookTime', '')
+        recipe['cookTime'] = updates['cookTime']
+        updated_fields.append('cookTime')
+        print(f"✓ Cook time: {old_value} → {updates['cookTime']}")
+
+    if 'servings' in updates and updates['servings'] is not None:
+        old_value = recipe.get('servings', '')
+        recipe['servings'] = updates['servings']
+        updated_fields.append('servings')
+        print(f"✓ Servings: {old_value} → {updates['servings']}")
+
+    if 'sourceUrl' in updates and updates['sourceUrl'] is not None:
+        old_value = recipe.get('sourceUrl', '')
+        recipe['sourceUrl'] = updates['sourceUrl']
+        updated_fields.append('sourceUrl')
+        print(f"✓ Source URL updated")
+        if old_value:
+            print(f"  Old: {old_value}")
+        print(f"  New: {updates['sourceUrl']}")
+
     if not updated_fields:
         print("\n⚠️  No fields were updated. Please provide at least one field to update.")
         return False